@@ -9,16 +9,26 @@ handling authentication, uploading, processing, and downloading automatically.
 
 import asyncio
 import base64
+import contextlib
+import email.utils
+import functools
 import hashlib
 import json
 import logging
 import mimetypes
 import os
+import random
+import stat
+import struct
+import sys
 import tempfile
+import time
 import uuid
-from datetime import datetime, timezone
-from typing import Any, Dict, Optional
+from datetime import datetime
+from types import MappingProxyType
+from typing import Any, AsyncIterator, Awaitable, BinaryIO, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple, Union
 
+import aiofiles
 import httpx
 
 # --- Logger Setup ---
@@ -31,10 +41,48 @@ try:
 except ImportError:
     _PIL_AVAILABLE = False
 
+# orjson check
+try:
+    import orjson
+    _ORJSON_AVAILABLE = True
+except ImportError:
+    _ORJSON_AVAILABLE = False
+
+# uvloop check (not available on Windows)
+if sys.platform != "win32":
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+
 # --- Module Constants ---
 REMINI_API_BASE_URL = "https://a.android.api.remini.ai/v1/mobile"
 REMINI_ORACLE_API_BASE_URL = "https://api.remini.ai/v1/mobile/oracle"
 DEFAULT_TOKEN_FILE = os.path.join(tempfile.gettempdir(), "remini_identity_token.json")
+UPLOAD_CHUNK_SIZE = 1 << 16
+HASH_CHUNK_SIZE = 1 << 20
+POLL_INITIAL_DELAY = 0.5
+POLL_MAX_DELAY = 5.0
+POLL_BACKOFF_FACTOR = 1.5
+POLL_JITTER = 0.2
+TOKEN_MAX_AGE = 6 * 60 * 60
+TOKEN_EXPIRY_MARGIN = 5 * 60
+DEFAULT_MAX_CONCURRENCY = 8
+_EXT_TO_MIME = MappingProxyType({
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".png": "image/png",
+    ".webp": "image/webp",
+})
+DOWNLOAD_PARTS = 8
+DOWNLOAD_MIN_PART_SIZE = 1 << 20
+CONNECT_RETRIES = 3
+RETRY_ATTEMPTS = 5
+RETRY_BASE_DELAY = 0.5
+RETRY_MAX_DELAY = 30.0
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "PUT"})
 
 # --- Custom Exception ---
 class ReminiError(Exception):
@@ -52,34 +100,407 @@ def _generate_device_ids() -> Dict[str, str]:
         "non_backup_persistent_id": str(uuid.uuid4()),
     }
 
-def _calculate_md5_base64(file_path: str) -> str:
-    """Calculates the MD5 hash of a file and returns it Base64 encoded."""
-    hash_md5 = hashlib.md5()
-    with open(file_path, "rb") as f:
-        for chunk in iter(lambda: f.read(4096), b""):
-            hash_md5.update(chunk)
-    return base64.b64encode(hash_md5.digest()).decode("utf-8")
-
-def _get_image_metadata(file_path: str) -> Dict[str, Any]:
-    """Extracts size, and if Pillow is available, width and height for image metadata."""
-    metadata = {"size": os.path.getsize(file_path)}
-    if _PIL_AVAILABLE:
+def _retry_delay(attempt: int, response: Optional[httpx.Response] = None) -> float:
+    """Returns how long to wait before a retry, honoring Retry-After when the server sends one."""
+    retry_after = response.headers.get("retry-after") if response is not None else None
+    if retry_after:
+        if retry_after.isdigit():
+            return min(float(retry_after), RETRY_MAX_DELAY)
         try:
-            with Image.open(file_path) as img:
-                metadata["width"], metadata["height"] = img.size
-        except Exception:
+            retry_at = email.utils.parsedate_to_datetime(retry_after)
+            return min(max(retry_at.timestamp() - time.time(), 0.0), RETRY_MAX_DELAY)
+        except (TypeError, ValueError):
             pass
-    return metadata
+    delay = min(RETRY_BASE_DELAY * 2 ** attempt, RETRY_MAX_DELAY)
+    return delay / 2 + random.random() * delay / 2
+
+def _retryable_errors(method: str) -> Tuple[type, ...]:
+    """Returns the transport errors worth retrying for ``method``.
+
+    Non-idempotent requests may already have taken effect server-side, so they only retry
+    errors raised before the request was sent.
+    """
+    if method in IDEMPOTENT_METHODS:
+        return (httpx.TimeoutException, httpx.NetworkError, httpx.RemoteProtocolError)
+    return (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+def _should_retry_response(method: str, response: httpx.Response) -> bool:
+    """Checks whether a response status is worth retrying for ``method``."""
+    if method in IDEMPOTENT_METHODS:
+        return response.status_code in RETRYABLE_STATUS_CODES
+    return response.status_code in (429, 503) and "retry-after" in response.headers
+
+async def _gather_cancelling(*aws: Awaitable[Any]) -> List[Any]:
+    """Like asyncio.gather, but cancels and awaits the remaining awaitables as soon as one fails."""
+    tasks = [asyncio.ensure_future(aw) for aw in aws]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+async def _aclose_body(content: Any):
+    """Closes a streamed request body (an async generator) if it has not been exhausted."""
+    aclose = getattr(content, "aclose", None)
+    if aclose is not None:
+        await aclose()
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serializes to compact UTF-8 JSON, using orjson when it is installed."""
+    if _ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+def _json_loads(data: bytes) -> Any:
+    """Parses JSON bytes, using orjson when it is installed."""
+    if _ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _read_jpeg_dims(f: BinaryIO) -> Optional[Tuple[int, int]]:
+    """Walks JPEG segments up to the first SOF marker and returns (width, height)."""
+    f.seek(2)
+    while True:
+        byte = f.read(1)
+        while byte and byte != b"\xff":
+            byte = f.read(1)
+        while byte == b"\xff":
+            byte = f.read(1)
+        if not byte:
+            return None
+        marker = byte[0]
+        if marker == 0x01 or 0xD0 <= marker <= 0xD8:
+            continue
+        if marker in (0xD9, 0xDA):
+            return None
+        segment = f.read(2)
+        if len(segment) < 2:
+            return None
+        length = struct.unpack(">H", segment)[0]
+        if 0xC0 <= marker <= 0xCF and marker not in (0xC4, 0xC8, 0xCC):
+            frame = f.read(5)
+            if len(frame) < 5:
+                return None
+            height, width = struct.unpack(">xHH", frame)
+            return width, height
+        f.seek(length - 2, os.SEEK_CUR)
+
+def _read_image_dims(f: BinaryIO) -> Optional[Tuple[int, int]]:
+    """Reads (width, height) from a PNG, JPEG or WebP header without decoding the image."""
+    header = f.read(32)
+    if header[:8] == b"\x89PNG\r\n\x1a\n" and header[12:16] == b"IHDR":
+        return struct.unpack(">II", header[16:24])
+    if header[:2] == b"\xff\xd8":
+        return _read_jpeg_dims(f)
+    if header[:4] == b"RIFF" and header[8:12] == b"WEBP" and len(header) >= 30:
+        chunk = header[12:16]
+        if chunk == b"VP8X":
+            return 1 + int.from_bytes(header[24:27], "little"), 1 + int.from_bytes(header[27:30], "little")
+        if chunk == b"VP8L" and header[20] == 0x2F:
+            bits = int.from_bytes(header[21:25], "little")
+            return (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1
+        if chunk == b"VP8 " and header[23:26] == b"\x9d\x01\x2a":
+            width, height = struct.unpack("<HH", header[26:30])
+            return width & 0x3FFF, height & 0x3FFF
+    return None
+
+def _jwt_expiry(token: str) -> Optional[float]:
+    """Returns the ``exp`` claim of a JWT without verifying it, or None if the token isn't a JWT."""
+    try:
+        payload = token.split(".")[1]
+        claims = _json_loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+        exp = claims.get("exp")
+    except (IndexError, ValueError, AttributeError):
+        return None
+    return float(exp) if isinstance(exp, (int, float)) else None
+
+@contextlib.contextmanager
+def _open_input(image_path: str) -> Iterator[int]:
+    """Opens an input image once and yields its descriptor, closing it on exit.
+
+    Anything other than a regular file is rejected up front; O_NONBLOCK keeps a FIFO from blocking the open.
+    """
+    try:
+        fd = os.open(image_path, os.O_RDONLY | getattr(os, "O_BINARY", 0) | getattr(os, "O_NONBLOCK", 0))
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Input file not found: {image_path}") from None
+    except IsADirectoryError:
+        raise ValueError(f"Input is not a regular file: {image_path}") from None
+    try:
+        if not stat.S_ISREG(os.fstat(fd).st_mode):
+            raise ValueError(f"Input is not a regular file: {image_path}")
+        yield fd
+    finally:
+        os.close(fd)
+
+def _reopen(fd: int) -> BinaryIO:
+    """Returns a file object over ``os.dup(fd)``, rewound to the start.
+
+    The duplicate has its own lifetime but shares the file offset with ``fd``, so callers must not
+    read through two of them at the same time.
+    """
+    f = os.fdopen(os.dup(fd), "rb")
+    f.seek(0)
+    return f
+
+def _scan_file(f: BinaryIO) -> Tuple[bytes, int, Optional[Tuple[int, int]]]:
+    """Returns the MD5 digest, size and dimensions of a file, read in a single pass, then closes it."""
+    with f:
+        size = os.fstat(f.fileno()).st_size
+        try:
+            dims = _read_image_dims(f)
+        except (OSError, struct.error):
+            dims = None
+        if dims is None and _PIL_AVAILABLE:
+            f.seek(0)
+            try:
+                # Fallback for formats without a built-in header parser.
+                with Image.open(f) as img:
+                    dims = img.size
+            except Exception:
+                pass
+        f.seek(0)
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(f, "md5").digest(), size, dims
+        hash_md5 = hashlib.md5()
+        buffer = bytearray(HASH_CHUNK_SIZE)
+        view = memoryview(buffer)
+        while n := f.readinto(buffer):
+            hash_md5.update(view[:n])
+        return hash_md5.digest(), size, dims
+
+def _reserve_output_path(image_path: str, output_dir: str = "") -> str:
+    """Atomically creates an empty, unused output file for an input image and returns its path.
+
+    The default name only has one-second resolution, so a counter is appended whenever it is taken.
+    """
+    name, ext = os.path.splitext(os.path.basename(image_path))
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    stem = os.path.join(output_dir, f"{name}_remini_{timestamp}")
+    candidate = f"{stem}{ext}"
+    counter = 1
+    while True:
+        try:
+            os.close(os.open(candidate, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0), 0o666))
+            return candidate
+        except FileExistsError:
+            candidate = f"{stem}_{counter}{ext}"
+            counter += 1
+
+@functools.lru_cache(maxsize=None)
+def _content_type_for_ext(ext: str) -> str:
+    """Returns the MIME type for a lowercased file extension, consulting mimetypes only once per extension."""
+    return _EXT_TO_MIME.get(ext) or mimetypes.guess_type(f"file{ext}")[0] or "image/jpeg"
+
+def _guess_content_type(file_path: str) -> str:
+    """Returns the MIME type for a file based on its extension."""
+    return _content_type_for_ext(os.path.splitext(file_path)[1].lower())
+
+async def _prepare_upload(file_path: str, fd: int) -> Dict[str, Any]:
+    """Hashes and measures an open file in a single read pass, returning the task's upload details."""
+    # All blocking reads run in a worker thread; OpenSSL releases the GIL while it digests.
+    loop = asyncio.get_running_loop()
+    # Duplicate on the loop thread: the caller may close ``fd`` as soon as this coroutine is
+    # cancelled, before a worker thread would have got to it. The worker owns and closes ``f``.
+    f = _reopen(fd)
+    try:
+        scan = loop.run_in_executor(None, _scan_file, f)
+    except BaseException:
+        f.close()
+        raise
+    digest, size, dims = await scan
+    metadata: Dict[str, Any] = {"size": size}
+    if dims:
+        metadata["width"], metadata["height"] = dims
+    return {
+        "content_type": _guess_content_type(file_path),
+        "md5": base64.b64encode(digest).decode("utf-8"),
+        "metadata": metadata,
+        "fd": fd,
+    }
 
 # --- Main Class ---
 class Remini:
     """A client for the unofficial Remini API."""
-    def __init__(self, token_path: str = DEFAULT_TOKEN_FILE):
+    __slots__ = (
+        "token_path",
+        "identity_token",
+        "_token_acquired_at",
+        "_device_ids",
+        "_install_ts",
+        "_android_headers",
+        "_api_headers",
+        "_json_headers",
+        "_client",
+        "_client_refs",
+        "_max_concurrency",
+        "_active_jobs",
+        "_admission",
+        "_admission_loop",
+        "_token_unverified",
+        "_token_refresh",
+        "_login_future",
+        "_range_client",
+    )
+
+    def __init__(self, token_path: str = DEFAULT_TOKEN_FILE, max_concurrency: int = DEFAULT_MAX_CONCURRENCY):
         """Initializes the Remini API client."""
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1.")
         self.token_path = token_path
+        self._device_ids: Mapping[str, str] = MappingProxyType(_generate_device_ids())
+        self._install_ts = f"{int(time.time())}E9"
+        self._android_headers: Mapping[str, str] = MappingProxyType(self._create_android_headers())
         self.identity_token: Optional[str] = None
-        self._device_ids = _generate_device_ids()
-        self._android_headers = self._create_android_headers()
+        self._token_acquired_at: Optional[float] = None
+        self._token_unverified = False
+        self._token_refresh: Optional["asyncio.Future[None]"] = None
+        self._login_future: Optional["asyncio.Future[None]"] = None
+        self._api_headers: Mapping[str, str]
+        self._json_headers: Mapping[str, str]
+        self._set_identity_token(None)
+        self._client: Optional[httpx.AsyncClient] = None
+        self._range_client: Optional[httpx.AsyncClient] = None
+        self._client_refs = 0
+        self._max_concurrency = max_concurrency
+        self._active_jobs = 0
+        self._admission: Optional[asyncio.Condition] = None
+        self._admission_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def __aenter__(self) -> "Remini":
+        """Opens the shared HTTP session; nested entries reuse the same client."""
+        if self._client is None:
+            # Options are set on the transport because httpx ignores client-level http2/limits once one is given.
+            # HTTP/2 multiplexes concurrent requests to a host onto one connection, which would serialize
+            # ranged downloads, so those use the HTTP/1.1 client from _get_range_client instead.
+            transport = httpx.AsyncHTTPTransport(
+                http2=True,
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=40),
+                retries=CONNECT_RETRIES,
+            )
+            self._client = httpx.AsyncClient(transport=transport, timeout=httpx.Timeout(30.0, connect=10.0))
+        self._client_refs += 1
+        return self
+
+    async def __aexit__(self, *exc_info):
+        """Closes the shared HTTP session once the outermost context exits."""
+        self._client_refs -= 1
+        if self._client_refs == 0 and self._client is not None:
+            # Login and token refresh are per session; stop any still running before the client goes away.
+            for pending in (self._login_future, self._token_refresh):
+                if pending is not None and not pending.done():
+                    pending.cancel()
+                    with contextlib.suppress(BaseException):
+                        await pending
+            self._login_future = None
+            self._token_refresh = None
+            if self._range_client is not None:
+                await self._range_client.aclose()
+                self._range_client = None
+            await self._client.aclose()
+            self._client = None
+
+    def _get_admission(self) -> asyncio.Condition:
+        """Returns the admission condition, creating it for the running event loop if needed."""
+        loop = asyncio.get_running_loop()
+        if self._admission is None or self._admission_loop is not loop:
+            self._admission = asyncio.Condition()
+            self._admission_loop = loop
+        return self._admission
+
+    @contextlib.asynccontextmanager
+    async def _admission_slot(self):
+        """Waits until fewer than max_concurrency jobs are running, then holds a slot."""
+        admission = self._get_admission()
+        async with admission:
+            await admission.wait_for(lambda: self._active_jobs < self._max_concurrency)
+            self._active_jobs += 1
+        try:
+            yield
+        finally:
+            async with admission:
+                self._active_jobs -= 1
+                admission.notify_all()
+
+    async def set_concurrency(self, max_concurrency: int):
+        """Changes how many process()/stylize() calls may run at once; waiting calls are re-checked."""
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1.")
+        self._max_concurrency = max_concurrency
+        admission = self._get_admission()
+        async with admission:
+            admission.notify_all()
+
+    async def _request(self, method: str, url: str, body: Optional[Callable[[], Any]] = None, **kwargs) -> httpx.Response:
+        """Sends a request on the shared client, retrying transient failures with backoff.
+
+        GET/HEAD/PUT retry timeouts, network errors, 429 and 5xx responses. Other methods may have
+        taken effect server-side, so they only retry errors raised before the request was sent and
+        429/503 responses that carry a Retry-After header.
+        ``body``, when given, is called on every attempt so streamed uploads can be replayed.
+        The last response is returned as-is; callers still decide how to treat its status.
+        """
+        retryable_errors = _retryable_errors(method)
+        content = None
+        try:
+            for attempt in range(RETRY_ATTEMPTS - 1):
+                if body is not None:
+                    # Release the previous attempt's partly read body (and its file handle) first.
+                    await _aclose_body(content)
+                    content = kwargs["content"] = body()
+                try:
+                    response = await self._client.request(method, url, **kwargs)
+                except retryable_errors as e:
+                    delay = _retry_delay(attempt)
+                    log.debug(f"{method} {url} failed ({e!r}), retrying in {delay:.1f}s...")
+                else:
+                    if not _should_retry_response(method, response):
+                        return response
+                    delay = _retry_delay(attempt, response)
+                    log.debug(f"{method} {url} returned {response.status_code}, retrying in {delay:.1f}s...")
+                await asyncio.sleep(delay)
+            if body is not None:
+                await _aclose_body(content)
+                content = kwargs["content"] = body()
+            return await self._client.request(method, url, **kwargs)
+        finally:
+            await _aclose_body(content)
+
+    async def _stream_request(
+        self,
+        method: str,
+        url: str,
+        consume: Callable[[httpx.Response], Awaitable[None]],
+        client: Optional[httpx.AsyncClient] = None,
+        **kwargs,
+    ):
+        """Streams a response into ``consume``, retrying the whole exchange with the same policy as _request.
+
+        Error statuses that are not retried raise httpx.HTTPStatusError with the body already read.
+        ``consume`` must tolerate being called again from scratch after a failed attempt.
+        """
+        client = client or self._client
+        retryable_errors = _retryable_errors(method)
+        for attempt in range(RETRY_ATTEMPTS):
+            last_attempt = attempt == RETRY_ATTEMPTS - 1
+            try:
+                async with client.stream(method, url, **kwargs) as response:
+                    if last_attempt or not _should_retry_response(method, response):
+                        if response.is_error:
+                            await response.aread()
+                        response.raise_for_status()
+                        await consume(response)
+                        return
+                    delay = _retry_delay(attempt, response)
+                    log.debug(f"{method} {url} returned {response.status_code}, retrying in {delay:.1f}s...")
+            except retryable_errors as e:
+                if last_attempt:
+                    raise
+                delay = _retry_delay(attempt)
+                log.debug(f"{method} {url} failed ({e!r}), retrying in {delay:.1f}s...")
+            await asyncio.sleep(delay)
 
     def _create_android_headers(self) -> Dict[str, str]:
         """Creates the base headers for API requests."""
@@ -102,44 +523,107 @@ class Remini:
             "user-agent": "okhttp/4.12.0",
         }
 
-    def _get_common_headers(self, content_type: Optional[str] = None) -> Dict[str, str]:
-        headers = self._android_headers.copy()
-        if self.identity_token:
-            headers["identity-token"] = self.identity_token
-        if content_type:
-            headers["content-type"] = content_type
-        return headers
+    def _set_identity_token(self, token: Optional[str], acquired_at: Optional[float] = None):
+        """Stores the identity token and rebuilds the per-session API headers once."""
+        self.identity_token = token
+        self._token_acquired_at = acquired_at
+        self._api_headers = MappingProxyType({**self._android_headers, "identity-token": token}) if token else self._android_headers
+        self._json_headers = MappingProxyType({**self._api_headers, "content-type": "application/json; charset=UTF-8"})
 
-    def _load_identity_token(self):
-        if os.path.exists(self.token_path):
-            try:
-                with open(self.token_path, "r") as f:
-                    data = json.load(f)
-                    self.identity_token = data.get("identity_token")
-            except (json.JSONDecodeError, IOError):
-                self.identity_token = None
+    async def _load_identity_token(self):
+        try:
+            async with aiofiles.open(self.token_path, "rb") as f:
+                data = _json_loads(await f.read())
+            self._set_identity_token(data.get("identity_token"), data.get("acquired_at"))
+        except FileNotFoundError:
+            pass
+        except (json.JSONDecodeError, IOError):
+            self._set_identity_token(None)
 
-    def _save_identity_token(self):
+    async def _save_identity_token(self):
         if self.identity_token:
-            with open(self.token_path, "w") as f:
-                json.dump({"identity_token": self.identity_token}, f, indent=4)
+            async with aiofiles.open(self.token_path, "wb") as f:
+                await f.write(_json_dumps({"identity_token": self.identity_token, "acquired_at": self._token_acquired_at}))
+
+    def _is_token_fresh(self) -> bool:
+        """Checks whether the cached token is recent enough to skip the profile probe."""
+        if not self.identity_token:
+            return False
+        expiry = _jwt_expiry(self.identity_token)
+        if expiry is not None:
+            return expiry - time.time() > TOKEN_EXPIRY_MARGIN
+        if not isinstance(self._token_acquired_at, (int, float)):
+            return False
+        return time.time() - self._token_acquired_at < TOKEN_MAX_AGE
 
     async def _login(self):
-        self._load_identity_token()
+        """Logs in once per session; concurrent callers share the same attempt, and a failed one is retried."""
+        login = self._login_future
+        if login is None or (login.done() and (login.cancelled() or login.exception() is not None)):
+            login = self._login_future = asyncio.ensure_future(self._login_once())
+        await asyncio.shield(login)
+
+    async def _login_once(self):
+        await self._load_identity_token()
+        if self._is_token_fresh():
+            # Trusted from its age or JWT expiry without asking the server; _api_request
+            # replaces it if the server rejects it anyway (e.g. revoked before expiry).
+            self._token_unverified = True
+            log.info("Reusing recently acquired token.")
+            return
+        self._token_unverified = False
         if self.identity_token and await self._get_user_profile():
             log.info("Successfully logged in with existing token.")
             return
 
         log.info("No valid token found. Requesting a new one...")
+        await self._refresh_token()
+
+    async def _refresh_token(self):
+        """Fetches a new identity token and activates the user profile with it."""
         await self._get_setup()
         if not await self._get_user_profile():
             raise ReminiError("Failed to activate user profile even with a new token.")
         log.info("New token acquired and user profile activated.")
 
+    def _can_refresh_rejected_token(self) -> bool:
+        """Checks whether a 401/403 may be caused by a stale token rather than a real permission error.
+
+        That covers cached tokens trusted from their age or JWT ``exp`` without a profile probe, and
+        JWTs whose expiry has passed since they were verified (e.g. during a long batch).
+        """
+        if self._token_unverified:
+            return True
+        expiry = _jwt_expiry(self.identity_token) if self.identity_token else None
+        return expiry is not None and expiry - time.time() <= TOKEN_EXPIRY_MARGIN
+
+    async def _api_request(self, method: str, url: str, json_body: bool = False, extra_headers: Optional[Mapping[str, str]] = None, **kwargs) -> httpx.Response:
+        """Sends an authenticated API request, replacing a rejected cached token and retrying once."""
+        def headers() -> Mapping[str, str]:
+            base = self._json_headers if json_body else self._api_headers
+            return {**base, **extra_headers} if extra_headers else base
+
+        token_used = self.identity_token
+        response = await self._request(method, url, headers=headers(), **kwargs)
+        if response.status_code not in (401, 403):
+            return response
+        refresh_idle = self._token_refresh is None or self._token_refresh.done()
+        if token_used == self.identity_token and refresh_idle and self._can_refresh_rejected_token():
+            log.info("Cached token was rejected. Requesting a new one...")
+            self._token_unverified = False
+            self._set_identity_token(None)
+            self._token_refresh = asyncio.ensure_future(self._refresh_token())
+        if self._token_refresh is not None:
+            # Concurrent requests rejected with the same token all wait on the one refresh.
+            await asyncio.shield(self._token_refresh)
+            if self.identity_token != token_used:
+                response = await self._request(method, url, headers=headers(), **kwargs)
+        return response
+
     async def _get_setup(self):
-        headers = self._get_common_headers()
-        headers.update({
-            "first-install-timestamp": f"{int(datetime.now(timezone.utc).timestamp() * 1000) / 1000:.0f}E9",
+        headers = {
+            **self._api_headers,
+            "first-install-timestamp": self._install_ts,
             "backup-persistent-id": self._device_ids["backup_persistent_id"],
             "non-backup-persistent-id": self._device_ids["non_backup_persistent_id"],
             "environment": "Production",
@@ -147,17 +631,16 @@ class Remini:
             "is-app-running-in-background": "false",
             "is-old-user": "true",
             "app-set-id": "d44bd45a-a45d-4470-9674-7348a8e3fb71",
-        })
+        }
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(f"{REMINI_ORACLE_API_BASE_URL}/setup", headers=headers)
-                response.raise_for_status()
-                data = response.json()
+            response = await self._request("GET", f"{REMINI_ORACLE_API_BASE_URL}/setup", headers=headers)
+            response.raise_for_status()
+            data = _json_loads(response.content)
             token = data.get("settings", {}).get("__identity__", {}).get("token")
             if not token:
                 raise ReminiError(f"Token not found in setup response: {data}")
-            self.identity_token = token
-            self._save_identity_token()
+            self._set_identity_token(token, time.time())
+            await self._save_identity_token()
         except httpx.HTTPStatusError as e:
             raise ReminiError(f"HTTP error during setup: {e.response.status_code} - {e.response.text}") from e
 
@@ -165,43 +648,44 @@ class Remini:
         if not self.identity_token:
             return False
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(f"{REMINI_API_BASE_URL}/users/@me", headers=self._get_common_headers())
-                response.raise_for_status()
-            user_data = response.json()
+            response = await self._request("GET", f"{REMINI_API_BASE_URL}/users/@me", headers=self._api_headers)
+            response.raise_for_status()
+            user_data = _json_loads(response.content)
             log.info(f"User profile activated. Balance: {user_data.get('balance', 'N/A')}")
             return True
         except httpx.HTTPStatusError:
             return False
 
-    async def _upload_file_to_gcs(self, upload_url: str, file_path: str, additional_headers: Dict[str, str]):
+    async def _upload_file_to_gcs(self, upload_url: str, fd: int, file_size: int, additional_headers: Mapping[str, str]):
+        async def file_chunks() -> AsyncIterator[bytes]:
+            async with aiofiles.open(os.dup(fd), "rb") as f:
+                await f.seek(0)
+                while chunk := await f.read(UPLOAD_CHUNK_SIZE):
+                    yield chunk
+
         try:
-            with open(file_path, "rb") as f:
-                file_content = f.read()
-            gcs_headers = additional_headers.copy()
-            gcs_headers["Content-Length"] = str(len(file_content))
-            gcs_headers["User-Agent"] = self._android_headers["user-agent"]
-            async with httpx.AsyncClient() as client:
-                response = await client.put(upload_url, headers=gcs_headers, content=file_content, timeout=120.0)
-                response.raise_for_status()
+            gcs_headers = {
+                **additional_headers,
+                "Content-Length": str(file_size),
+                "User-Agent": self._android_headers["user-agent"],
+            }
+            response = await self._request("PUT", upload_url, body=file_chunks, headers=gcs_headers, timeout=120.0)
+            response.raise_for_status()
         except httpx.HTTPStatusError as e:
             raise ReminiError(f"GCS upload failed: {e.response.status_code} - {e.response.text}") from e
 
-    async def _create_image_task(self, file_path: str, feature_payload: Dict[str, Any]) -> str:
-        mime_type = mimetypes.guess_type(file_path)[0] or "image/jpeg"
+    async def _create_image_task(self, upload: Dict[str, Any], feature_payload: Dict[str, Any]) -> str:
         request_body = {
-            "image_content_type": mime_type,
-            "image_md5": _calculate_md5_base64(file_path),
+            "image_content_type": upload["content_type"],
+            "image_md5": upload["md5"],
             "feature": feature_payload,
-            "metadata": _get_image_metadata(file_path),
+            "metadata": upload["metadata"],
             "options": {"high_quality_output": False, "save_input": True},
         }
         try:
-            headers = self._get_common_headers("application/json; charset=UTF-8")
-            async with httpx.AsyncClient(headers=headers, timeout=30.0) as client:
-                response = await client.post(f"{REMINI_API_BASE_URL}/tasks", json=request_body)
-                response.raise_for_status()
-            upload_info = response.json()
+            response = await self._api_request("POST", f"{REMINI_API_BASE_URL}/tasks", json_body=True, content=_json_dumps(request_body))
+            response.raise_for_status()
+            upload_info = _json_loads(response.content)
             task_id = upload_info.get("task_id")
             upload_url = upload_info.get("upload_url")
             upload_headers = upload_info.get("upload_headers")
@@ -209,17 +693,15 @@ class Remini:
                 raise ReminiError(f"Missing required fields in task response: {upload_info}")
         except httpx.HTTPStatusError as e:
             raise ReminiError(f"Upload URL request failed: {e.response.status_code} - {e.response.text}") from e
-        await self._upload_file_to_gcs(upload_url, file_path, upload_headers)
+        await self._upload_file_to_gcs(upload_url, upload["fd"], upload["metadata"]["size"], upload_headers)
         return task_id
 
     async def _reprocess_image_task(self, base_task_id: str, feature_payload: Dict[str, Any]) -> str:
         """Sends a request to reprocess an existing task with a new feature."""
         try:
-            headers = self._get_common_headers("application/json; charset=UTF-8")
-            async with httpx.AsyncClient(headers=headers, timeout=30.0) as client:
-                response = await client.post(f"{REMINI_API_BASE_URL}/tasks/{base_task_id}/reprocess", json={"feature": feature_payload})
-                response.raise_for_status()
-            data = response.json()
+            response = await self._api_request("POST", f"{REMINI_API_BASE_URL}/tasks/{base_task_id}/reprocess", json_body=True, content=_json_dumps({"feature": feature_payload}))
+            response.raise_for_status()
+            data = _json_loads(response.content)
             new_task_id = data.get("task_id")
             if not new_task_id:
                 raise ReminiError(f"Reprocessing did not return a new task ID: {data}")
@@ -229,27 +711,33 @@ class Remini:
 
     async def _ping_for_processing(self, task_id: str):
         try:
-            headers = self._get_common_headers()
-            headers["content-length"] = "0"
-            async with httpx.AsyncClient(headers=headers) as client:
-                response = await client.post(f"{REMINI_API_BASE_URL}/tasks/{task_id}/process")
-                response.raise_for_status()
+            # httpx sends "content-length: 0" itself for an empty POST body.
+            response = await self._api_request("POST", f"{REMINI_API_BASE_URL}/tasks/{task_id}/process")
+            response.raise_for_status()
         except httpx.HTTPStatusError as e:
             raise ReminiError(f"Processing ping failed: {e.response.status_code} - {e.response.text}") from e
 
     async def _poll_status_http(self, task_id: str) -> Optional[str]:
         """Polls for task completion and returns the output URL."""
         log.info(f"Polling for status of task {task_id}...")
+        delay = POLL_INITIAL_DELAY
+        etag: Optional[str] = None
         while True:
-            await asyncio.sleep(5)
+            await asyncio.sleep(delay + random.random() * POLL_JITTER)
+            delay = min(delay * POLL_BACKOFF_FACTOR, POLL_MAX_DELAY)
             try:
-                async with httpx.AsyncClient() as client:
-                    response = await client.get(f"{REMINI_API_BASE_URL}/tasks/{task_id}", headers=self._get_common_headers())
+                response = await self._api_request(
+                    "GET", f"{REMINI_API_BASE_URL}/tasks/{task_id}", extra_headers={"if-none-match": etag} if etag else None
+                )
                 if response.status_code == 404:
                     log.debug(f"Task {task_id} not found yet, continuing to poll...")
                     continue
+                if response.status_code == 304:
+                    log.debug(f"Task {task_id} unchanged, continuing to poll...")
+                    continue
                 response.raise_for_status()
-                data = response.json()
+                etag = response.headers.get("etag")
+                data = _json_loads(response.content)
             except httpx.HTTPStatusError as e:
                 raise ReminiError(f"HTTP polling failed: {e.response.status_code} - {e.response.text}") from e
 
@@ -263,18 +751,106 @@ class Remini:
             elif status in ["failed", "error"]:
                 raise ReminiError(f"Task failed during processing: {data.get('errors')}")
 
+    async def _process_and_poll(self, task_id: str) -> Optional[str]:
+        """Sends the processing ping and starts polling at the same time, returning the output URL."""
+        ping = asyncio.ensure_future(self._ping_for_processing(task_id))
+        poll = asyncio.ensure_future(self._poll_status_http(task_id))
+        try:
+            await ping
+            return await poll
+        finally:
+            ping.cancel()
+            poll.cancel()
+
     async def _download_file(self, url: str, output_path: str):
+        """Downloads a file, splitting it into parallel range requests when the server allows it."""
+        headers = {"user-agent": self._android_headers["user-agent"], "accept-encoding": "identity"}
         try:
-            async with httpx.AsyncClient() as client:
-                async with client.stream("GET", url, headers={"user-agent": self._android_headers["user-agent"]}, timeout=120.0) as response:
-                    response.raise_for_status()
-                    with open(output_path, "wb") as f:
-                        async for chunk in response.aiter_bytes():
-                            f.write(chunk)
+            size = await self._probe_download_size(url, headers)
+            if size is None or size < 2 * DOWNLOAD_MIN_PART_SIZE:
+                await self._download_stream(url, output_path, headers)
+            else:
+                await self._download_ranges(url, output_path, size, headers)
         except httpx.HTTPStatusError as e:
             raise ReminiError(f"Download failed: {e.response.status_code} - {e.response.text}") from e
 
-    async def _process_common(self, image_path: str, output_path: Optional[str], verbose: bool, final_url: Optional[str]):
+    async def _probe_download_size(self, url: str, headers: Mapping[str, str]) -> Optional[int]:
+        """Returns the file size if a HEAD request shows byte ranges are supported, else None."""
+        try:
+            head = await self._request("HEAD", url, headers=headers, timeout=120.0)
+        except httpx.TransportError as e:
+            log.debug(f"HEAD {url} failed ({e!r}), falling back to a single download.")
+            return None
+        # Signed URLs are often valid for GET only, so a rejected HEAD is not an error here.
+        if head.is_error or head.headers.get("accept-ranges") != "bytes":
+            return None
+        try:
+            return int(head.headers["content-length"])
+        except (KeyError, ValueError):
+            return None
+
+    async def _download_stream(self, url: str, output_path: str, headers: Mapping[str, str]):
+        async def write_file(response: httpx.Response):
+            async with aiofiles.open(output_path, "wb") as f:
+                async for chunk in response.aiter_bytes():
+                    await f.write(chunk)
+
+        await self._stream_request("GET", url, write_file, headers=headers, timeout=120.0)
+
+    def _get_range_client(self) -> httpx.AsyncClient:
+        """Returns the session's HTTP/1.1 client for ranged downloads, creating it on first use.
+
+        The shared client speaks HTTP/2, which would multiplex every range onto one TCP connection
+        and keep the per-connection throughput limit the ranges are meant to avoid.
+        """
+        if self._range_client is None:
+            transport = httpx.AsyncHTTPTransport(
+                http2=False,
+                limits=httpx.Limits(
+                    max_keepalive_connections=DOWNLOAD_PARTS,
+                    max_connections=DOWNLOAD_PARTS * DEFAULT_MAX_CONCURRENCY,
+                ),
+                retries=CONNECT_RETRIES,
+            )
+            self._range_client = httpx.AsyncClient(transport=transport, timeout=httpx.Timeout(30.0, connect=10.0))
+        return self._range_client
+
+    async def _download_part(self, url: str, output_path: str, lo: int, hi: int, headers: Mapping[str, str]):
+        """Streams the byte range lo..hi of ``url`` into the same offsets of ``output_path``."""
+        expected = hi - lo + 1
+
+        async def write_range(response: httpx.Response):
+            if response.status_code != 206:
+                raise ReminiError(f"Server did not honor range request bytes={lo}-{hi}.")
+            written = 0
+            async with aiofiles.open(output_path, "r+b") as f:
+                # A retry rewrites the whole part from its start offset.
+                await f.seek(lo)
+                async for chunk in response.aiter_bytes():
+                    written += len(chunk)
+                    if written > expected:
+                        raise ReminiError(f"Server sent too much data for range bytes={lo}-{hi}.")
+                    await f.write(chunk)
+            if written != expected:
+                raise httpx.RemoteProtocolError(f"Range bytes={lo}-{hi} ended after {written} of {expected} bytes.")
+
+        range_headers = {**headers, "range": f"bytes={lo}-{hi}"}
+        await self._stream_request("GET", url, write_range, client=self._get_range_client(), headers=range_headers, timeout=120.0)
+
+    async def _download_ranges(self, url: str, output_path: str, size: int, headers: Mapping[str, str]):
+        part_count = min(DOWNLOAD_PARTS, size // DOWNLOAD_MIN_PART_SIZE)
+        part_size = -(-size // part_count)
+        semaphore = asyncio.Semaphore(DOWNLOAD_PARTS)
+
+        async def fetch_part(lo: int, hi: int):
+            async with semaphore:
+                await self._download_part(url, output_path, lo, hi, headers)
+
+        async with aiofiles.open(output_path, "wb") as f:
+            await f.truncate(size)
+        await _gather_cancelling(*(fetch_part(lo, min(lo + part_size, size) - 1) for lo in range(0, size, part_size)))
+
+    async def _process_common(self, image_path: str, output_path: Optional[str], verbose: bool, final_url: Optional[str], output_dir: str = "") -> str:
         """Common logic for processing and downloading."""
         if verbose and not logging.getLogger().handlers:
             logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
@@ -282,56 +858,88 @@ class Remini:
         if not final_url:
             raise ReminiError("Processing failed, no final URL was generated.")
 
-        if not output_path:
-            name, ext = os.path.splitext(os.path.basename(image_path))
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            output_path = f"{name}_remini_{timestamp}{ext}"
+        reserved = not output_path
+        if reserved:
+            output_path = _reserve_output_path(image_path, output_dir)
 
         log.info(f"Downloading enhanced image to: {output_path}")
-        await self._download_file(final_url, output_path)
+        try:
+            await self._download_file(final_url, output_path)
+        except BaseException:
+            if reserved:
+                with contextlib.suppress(OSError):
+                    os.remove(output_path)
+            raise
         log.info("Download finished successfully.")
+        return output_path
 
-    async def process(self, image_path: str, output_path: Optional[str] = None, verbose: bool = True):
-        """Enhances an image with the default 'enhance' feature."""
-        if not os.path.exists(image_path):
-            raise FileNotFoundError(f"Input file not found: {image_path}")
-
-        await self._login()
-
+    async def _enhance(self, image_path: str, upload: Dict[str, Any], output_path: Optional[str], verbose: bool, output_dir: str = "") -> str:
+        """Runs the standard enhancement for an already prepared upload on a logged-in session."""
         log.info("Submitting image for standard enhancement...")
         feature = {"type": "enhance", "models": []}
-        task_id = await self._create_image_task(image_path, feature)
+        task_id = await self._create_image_task(upload, feature)
         log.info(f"Image uploaded. Task ID: {task_id}")
 
-        await self._ping_for_processing(task_id)
-        final_url = await self._poll_status_http(task_id)
-
-        await self._process_common(image_path, output_path, verbose, final_url)
-
-    async def stylize(self, image_path: str, style: str, output_path: Optional[str] = None, verbose: bool = True):
-        """Applies a stylization effect to an image (e.g., 'toon')."""
-        if not os.path.exists(image_path):
-            raise FileNotFoundError(f"Input file not found: {image_path}")
-
-        await self._login()
-
-        log.info("Step 1/4: Creating a base task for stylization...")
-        base_feature = {"type": "enhance", "models": []}
-        base_task_id = await self._create_image_task(image_path, base_feature)
-        log.info(f"Base task created. Task ID: {base_task_id}")
-
-        await self._ping_for_processing(base_task_id)
-        base_task_url = await self._poll_status_http(base_task_id)
-        if not base_task_url:
-             raise ReminiError("Base task did not complete successfully. Cannot proceed with stylization.")
-        log.info("Step 2/4: Base task completed.")
-
-        log.info(f"Step 3/4: Reprocessing with '{style}' style...")
-        style_feature = {"type": "stylization-v2", "pipelines": [{"id": style}]}
-        reprocess_task_id = await self._reprocess_image_task(base_task_id, style_feature)
-        log.info(f"Reprocessing started. New task ID: {reprocess_task_id}")
-
-        log.info("Step 4/4: Waiting for stylization to complete...")
-        final_url = await self._poll_status_http(reprocess_task_id)
-
-        await self._process_common(image_path, output_path, verbose, final_url)
+        final_url = await self._process_and_poll(task_id)
+
+        return await self._process_common(image_path, output_path, verbose, final_url, output_dir)
+
+    async def process(self, image_path: str, output_path: Optional[str] = None, verbose: bool = True) -> str:
+        """Enhances an image with the default 'enhance' feature and returns the output path."""
+        async with self, self._admission_slot():
+            with _open_input(image_path) as fd:
+                _, upload = await _gather_cancelling(self._login(), _prepare_upload(image_path, fd))
+                return await self._enhance(image_path, upload, output_path, verbose)
+
+    async def process_many(
+        self,
+        image_paths: Iterable[str],
+        output_dir: Optional[str] = None,
+        concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        verbose: bool = True,
+    ) -> List[Union[str, BaseException]]:
+        """Enhances several images over one session and a single login.
+
+        Returns one entry per input, in order: the output path, or the exception that image failed with.
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1.")
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def enhance_one(image_path: str) -> str:
+            async with semaphore, self._admission_slot():
+                with _open_input(image_path) as fd:
+                    upload = await _prepare_upload(image_path, fd)
+                    return await self._enhance(image_path, upload, None, verbose, output_dir or "")
+
+        async with self:
+            await self._login()
+            if output_dir:
+                os.makedirs(output_dir, exist_ok=True)
+            return await asyncio.gather(*(enhance_one(path) for path in image_paths), return_exceptions=True)
+
+    async def stylize(self, image_path: str, style: str, output_path: Optional[str] = None, verbose: bool = True) -> str:
+        """Applies a stylization effect to an image (e.g., 'toon') and returns the output path."""
+        async with self, self._admission_slot():
+            with _open_input(image_path) as fd:
+                _, upload = await _gather_cancelling(self._login(), _prepare_upload(image_path, fd))
+
+                log.info("Step 1/4: Creating a base task for stylization...")
+                base_feature = {"type": "enhance", "models": []}
+                base_task_id = await self._create_image_task(upload, base_feature)
+                log.info(f"Base task created. Task ID: {base_task_id}")
+
+                base_task_url = await self._process_and_poll(base_task_id)
+                if not base_task_url:
+                    raise ReminiError("Base task did not complete successfully. Cannot proceed with stylization.")
+                log.info("Step 2/4: Base task completed.")
+
+                log.info(f"Step 3/4: Reprocessing with '{style}' style...")
+                style_feature = {"type": "stylization-v2", "pipelines": [{"id": style}]}
+                reprocess_task_id = await self._reprocess_image_task(base_task_id, style_feature)
+                log.info(f"Reprocessing started. New task ID: {reprocess_task_id}")
+
+                log.info("Step 4/4: Waiting for stylization to complete...")
+                final_url = await self._poll_status_http(reprocess_task_id)
+
+                return await self._process_common(image_path, output_path, verbose, final_url)